@@ -0,0 +1,658 @@
+# -*- coding: utf-8 -*-
+"""
+Chargement des bindings GTFS-rt et helpers (GTFS statique, polylines, décodage du flux).
+Module importé une seule fois : les caches (lru_cache, st.cache_*) survivent aux reruns
+de streamlit_app.py, qui ré-exécute tout le script à chaque interaction.
+"""
+import os
+
+# Backend protobuf natif (upb) plutôt que pure-Python : doit être fixé avant le premier import
+# de google.protobuf. Sous `streamlit run`, streamlit importe protobuf avant ce module : la
+# variable doit alors venir de l'environnement (cf. .devcontainer) ; protobuf >= 4.21 choisit upb par défaut.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import io
+import csv
+import gzip
+import zlib
+import zipfile
+import tempfile
+import urllib.request
+import shutil
+import functools
+import hashlib
+import sys
+from collections.abc import Sequence
+from typing import NamedTuple
+import numpy as np
+import streamlit as st
+import pandas as pd
+from google.protobuf.message import DecodeError
+from google.protobuf import text_format
+from google.protobuf.internal import api_implementation
+from google.protobuf.internal.decoder import _DecodeVarint
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow vient avec streamlit, mais pandas suffit en secours
+    pa = pc = pacsv = None
+
+try:
+    from poly_numba import decode_polyline_buf
+except ImportError:  # numba optionnel : décodage NumPy / Python sinon
+    decode_polyline_buf = None
+
+# ============================================================
+# 1) Charger les bindings GTFS-rt, avec fallback compilation
+# ============================================================
+# Dossier de l'app : contient un gtfs_realtime_pb2.py pré-généré (protoc, proto officielle)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bindings compilés par le fallback, conservés entre deux démarrages hors du dépôt :
+# un sous-dossier par empreinte sha256 de la proto, le fichier CURRENT désigne le dernier
+GENERATED_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "gtfsrt-proto",
+)
+
+def _current_generated_dir() -> str | None:
+    """Dossier du dernier module compilé (d'après GENERATED_DIR/CURRENT), ou None."""
+    try:
+        with open(os.path.join(GENERATED_DIR, "CURRENT"), encoding="ascii") as f:
+            digest = f.read().strip()
+    except OSError:
+        return None
+    return os.path.join(GENERATED_DIR, digest) if digest.isalnum() else None
+
+def _save_generated(tmpdir: str, digest: str) -> None:
+    """Copie le module compilé sous GENERATED_DIR/<digest> puis bascule CURRENT (renommages atomiques)."""
+    target = os.path.join(GENERATED_DIR, digest)
+    os.makedirs(target, exist_ok=True)
+    tmp_copy = os.path.join(target, f".gtfs_realtime_pb2.{os.getpid()}.tmp")
+    shutil.copyfile(os.path.join(tmpdir, "gtfs_realtime_pb2.py"), tmp_copy)
+    os.replace(tmp_copy, os.path.join(target, "gtfs_realtime_pb2.py"))
+    tmp_current = os.path.join(GENERATED_DIR, f".CURRENT.{os.getpid()}.tmp")
+    with open(tmp_current, "w", encoding="ascii") as f:
+        f.write(digest)
+    os.replace(tmp_current, os.path.join(GENERATED_DIR, "CURRENT"))
+
+def _import_generated(folder: str | None):
+    """Importe gtfs_realtime_pb2 depuis `folder` s'il existe et contient trip_modifications, sinon None."""
+    if folder is None or not os.path.isfile(os.path.join(folder, "gtfs_realtime_pb2.py")):
+        return None
+    sys.path.insert(0, folder)
+    try:
+        import gtfs_realtime_pb2 as pb  # type: ignore
+    except Exception:
+        sys.path.remove(folder)
+        return None
+    if "trip_modifications" not in pb.FeedEntity().DESCRIPTOR.fields_by_name:
+        sys.modules.pop("gtfs_realtime_pb2", None)
+        sys.path.remove(folder)
+        return None
+    return pb
+
+@st.cache_resource(show_spinner=False)
+def load_proto():
+    """
+    1) Essaie d'importer le binding google.transit.gtfs_realtime_pb2 installé.
+    2) Sinon, importe le gtfs_realtime_pb2.py pré-généré livré avec l'app (APP_DIR).
+    3) Sinon, réutilise le module compilé lors d'un lancement précédent (GENERATED_DIR).
+    4) En dernier recours, télécharge la proto officielle, compile en Python via grpc_tools.protoc,
+       importe le module généré et le conserve dans GENERATED_DIR pour les démarrages suivants.
+    """
+    # a) Binding installé ?
+    try:
+        from google.transit import gtfs_realtime_pb2 as pb
+        # Vérifie la présence de l'entité expérimentale
+        if "trip_modifications" in pb.FeedEntity().DESCRIPTOR.fields_by_name:
+            return pb, "bindings"
+    except Exception:
+        pass
+
+    # b) Module pré-généré livré avec l'app (pas de réseau ni de protoc au démarrage)
+    pb = _import_generated(APP_DIR)
+    if pb is not None:
+        return pb, "vendored"
+
+    # c) Module déjà compilé lors d'un démarrage précédent ?
+    pb = _import_generated(_current_generated_dir())
+    if pb is not None:
+        return pb, "cached-compiled"
+
+    # d) Fallback : compiler la proto officielle au runtime
+    try:
+        from grpc_tools import protoc
+    except Exception as e:
+        st.error(
+            "Le paquet 'grpcio-tools' est requis pour compiler la proto GTFS‑rt.\n"
+            "Ajoute-le dans requirements.txt puis redéploie."
+        )
+        st.exception(e)
+        st.stop()
+
+    try:
+        PROTO_URL = ("https://raw.githubusercontent.com/google/transit/"
+                     "master/gtfs-realtime/proto/gtfs-realtime.proto")
+        with urllib.request.urlopen(PROTO_URL, timeout=15) as r:  # HTTPError si statut ≥ 400
+            proto_src = r.read()
+        tmpdir = tempfile.mkdtemp()
+        proto_path = f"{tmpdir}/gtfs-realtime.proto"
+        with open(proto_path, "wb") as f:
+            f.write(proto_src)
+
+        ret = protoc.main(["protoc", f"-I{tmpdir}", f"--python_out={tmpdir}", proto_path])
+        if ret != 0:
+            raise RuntimeError(f"protoc a échoué (code={ret}).")
+
+        sys.path.insert(0, tmpdir)
+        import gtfs_realtime_pb2 as pb  # type: ignore
+
+        if "trip_modifications" not in pb.FeedEntity().DESCRIPTOR.fields_by_name:
+            raise RuntimeError("Bindings générés sans 'trip_modifications'.")
+        try:
+            _save_generated(tmpdir, hashlib.sha256(proto_src).hexdigest())
+        except OSError:
+            pass  # cache non inscriptible : on recompilera au prochain démarrage
+        return pb, "fallback-compiled"
+    except Exception as e:
+        st.error("Impossible de charger/compilier 'gtfs-realtime.proto'.")
+        st.exception(e)
+        st.stop()
+
+pb, proto_mode = load_proto()
+PROTOBUF_BACKEND = api_implementation.Type()
+
+# Champs (expérimentaux) de FeedEntity présents dans le schéma : fixés une fois les bindings chargés
+ENTITY_HAS_TRIP_MODS = "trip_modifications" in pb.FeedEntity.DESCRIPTOR.fields_by_name
+ENTITY_HAS_SHAPE = "shape" in pb.FeedEntity.DESCRIPTOR.fields_by_name
+# Numéros de champ des entités utiles à l'app (pré-filtrage binaire, cf. scan_entities)
+ENTITY_WANTED_FIELDS = frozenset(
+    pb.FeedEntity.DESCRIPTOR.fields_by_name[name].number
+    for name in ("trip_modifications", "shape") if name in pb.FeedEntity.DESCRIPTOR.fields_by_name
+)
+
+# ============================================================
+# 2) Helpers
+# ============================================================
+# Fichiers GTFS utilisés par l'app et colonnes chargées ; le reste de l'archive est ignoré
+GTFS_USECOLS: dict[str, list[str]] = {
+    "stops.txt": ["stop_id", "stop_name", "stop_lat", "stop_lon", "location_type"],
+    "trips.txt": ["trip_id", "shape_id"],
+    "stop_times.txt": ["trip_id", "stop_id", "stop_sequence"],
+    "shapes.txt": ["shape_id", "shape_pt_lat", "shape_pt_lon", "shape_pt_sequence"],
+}
+
+# Tables triées une fois au chargement : (clé, colonne de séquence convertie en float, ou None)
+# → recherche d'un identifiant par dichotomie (sorted_rows) au lieu d'un balayage complet
+GTFS_PRESORT: dict[str, tuple[str, str | None]] = {
+    "trips.txt": ("trip_id", None),
+    "shapes.txt": ("shape_id", "shape_pt_sequence"),
+    "stop_times.txt": ("trip_id", "stop_sequence"),
+}
+
+# Coordonnées converties une fois en float64 au chargement (NaN si invalide)
+GTFS_FLOAT_COLS: dict[str, list[str]] = {
+    "stops.txt": ["stop_lat", "stop_lon"],
+    "shapes.txt": ["shape_pt_lat", "shape_pt_lon"],
+}
+
+CSV_BLOCK_SIZE = 1 << 20
+
+# Nombre d'uploads distincts gardés en cache (GTFS décodés, flux RT)
+CACHE_MAX_ENTRIES = 4
+
+def _read_gtfs_csv_pandas(zf: zipfile.ZipFile, member: str, usecols: list[str] | None) -> pd.DataFrame:
+    """Lecture pandas : lignes trop courtes complétées par "", doublons d'en-tête renommés "col.1"."""
+    with zf.open(member) as f:
+        cols = (lambda c: c in usecols) if usecols is not None else None
+        return pd.read_csv(f, dtype=str, usecols=cols).fillna("")
+
+def read_gtfs_csv(zf: zipfile.ZipFile, member: str, usecols: list[str] | None = None) -> pd.DataFrame:
+    """
+    Lit un .txt GTFS de l'archive en DataFrame de chaînes (valeurs vides → "").
+    Avec pyarrow, le membre est lu en flux par blocs et les colonnes restent des
+    chaînes Arrow (pas d'objets Python par cellule). Arrow refuse les lignes au nombre
+    de champs irrégulier : le fichier est alors relu par pandas, plus tolérant.
+    """
+    if pacsv is None:
+        return _read_gtfs_csv_pandas(zf, member, usecols)
+
+    with zf.open(member) as f:
+        header = f.readline().decode("utf-8-sig").strip("\r\n")
+    # En-têtes en double renommés comme pandas ("col", "col.1"…) : seule la 1re occurrence
+    # garde le nom attendu, une colonne lue reste une Series
+    names, seen = [], {}
+    for c in next(csv.reader([header]), []):
+        n = seen.get(c, 0); seen[c] = n + 1
+        names.append(f"{c}.{n}" if n else c)
+    include = [c for c in names if c in usecols] if usecols is not None else None
+    try:
+        with zf.open(member) as f:
+            reader = pacsv.open_csv(
+                f,
+                read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE, column_names=names, skip_rows=1),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={c: pa.string() for c in names},
+                    include_columns=include,
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            table = reader.read_all()
+    except pa.ArrowInvalid:
+        return _read_gtfs_csv_pandas(zf, member, usecols)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def to_float(values: pd.Series) -> np.ndarray:
+    """
+    Colonne texte → float64 (NaN si vide ou invalide).
+    Colonne Arrow : cast natif pyarrow (~20× plus rapide que pd.to_numeric, qui repasse
+    par des objets Python) ; si une valeur n'est pas un nombre, coercition tolérante de pandas.
+    """
+    if pc is not None and isinstance(values.dtype, pd.ArrowDtype):
+        arr = pa.array(values)
+        arr = pc.if_else(pc.equal(arr, ""), pa.scalar(None, arr.type), arr)
+        try:
+            return pc.cast(arr, pa.float64()).to_numpy(zero_copy_only=False)  # null → NaN
+        except pa.ArrowInvalid:
+            pass
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+
+def to_category(values: pd.Series) -> pd.Categorical:
+    """
+    Colonne texte → Categorical à catégories triées (codes croissants dans l'ordre des chaînes).
+    Colonne Arrow : encodage dictionnaire natif, puis rang de chaque entrée du dictionnaire
+    trié ; seules les valeurs distinctes deviennent des str Python, pas chaque ligne.
+    """
+    if pc is None or not isinstance(values.dtype, pd.ArrowDtype) or values.hasnans or values.empty:
+        return pd.Categorical(values.astype(object))
+    arr = pa.array(values)  # Array ou ChunkedArray selon le nombre de blocs lus
+    enc = pc.dictionary_encode(pa.chunked_array(getattr(arr, "chunks", [arr]))).unify_dictionaries()
+    dictionary = enc.chunk(0).dictionary
+    order = pc.array_sort_indices(dictionary).to_numpy()  # ordre octet UTF-8 = ordre des str
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    indices = np.concatenate([c.indices.to_numpy() for c in enc.chunks])
+    return pd.Categorical.from_codes(rank[indices], categories=dictionary.take(order).to_pylist())
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def load_gtfs_zip(gtfs_bytes: bytes) -> dict[str, pd.DataFrame]:
+    zf = zipfile.ZipFile(io.BytesIO(gtfs_bytes))
+    dfs = {}
+    for name in zf.namelist():
+        key = name.split("/")[-1].lower()
+        if key in GTFS_USECOLS:
+            dfs[key] = read_gtfs_csv(zf, name, GTFS_USECOLS[key])
+
+    for key, cols in GTFS_FLOAT_COLS.items():
+        df = dfs.get(key)
+        if df is None:
+            continue
+        for col in cols:
+            if col in df.columns:
+                df[col] = to_float(df[col])
+
+    for key, (id_col, seq_col) in GTFS_PRESORT.items():
+        df = dfs.get(key)
+        if df is None or id_col not in df.columns:
+            continue
+        # Identifiants en catégories : codes entiers triés avec les lignes (searchsorted direct)
+        # et une seule chaîne par valeur distincte, d'où un pickle ~10× plus léger à chaque
+        # relecture du cache st.cache_data
+        df[id_col] = to_category(df[id_col])
+        by = [id_col]
+        if seq_col is not None and seq_col in df.columns:
+            df[seq_col] = to_float(df[seq_col])
+            by.append(seq_col)
+        dfs[key] = df.sort_values(by, kind="stable", ignore_index=True)
+    return dfs
+
+def sorted_rows(df: pd.DataFrame, col: str, value: str) -> slice:
+    """Plage [lo, hi) des lignes où df[col] == value, pour une table triée sur col (cf. GTFS_PRESORT)."""
+    ids = df[col].array
+    if isinstance(ids, pd.Categorical):
+        # Catégories triées : la recherche porte sur les codes, croissants avec les lignes
+        try:
+            code = ids.categories.get_loc(value)
+        except KeyError:
+            return slice(0, 0)
+        ids, value = ids.codes, ids.codes.dtype.type(code)  # même dtype : pas de conversion du tableau
+    ids = np.asarray(ids)
+    return slice(int(ids.searchsorted(value, side="left")), int(ids.searchsorted(value, side="right")))
+
+def latlon_points(lat: pd.Series, lon: pd.Series) -> np.ndarray:
+    """Empile deux colonnes en tableau (N, 2) de (lat, lon) float64, sans les valeurs non numériques."""
+    pts = np.column_stack((to_float(lat), to_float(lon)))
+    return pts[~np.isnan(pts).any(axis=1)]
+
+def build_trip_shape(dfs: dict[str, pd.DataFrame], trip_id: str,
+                     stop_lookup: "StopLookup | None" = None
+                     ) -> np.ndarray:
+    """Tracé (N, 2) en (lat, lon) du trip : shapes.txt si disponible, sinon la chaîne de ses arrêts."""
+    trips = dfs.get("trips.txt"); stimes = dfs.get("stop_times.txt")
+    stops = dfs.get("stops.txt"); shapes = dfs.get("shapes.txt")
+    pts = np.empty((0, 2))
+
+    if trips is not None and shapes is not None and "shape_id" in trips.columns:
+        rows = sorted_rows(trips, "trip_id", trip_id)  # trips.txt trié par trip_id au chargement
+        if rows.stop > rows.start:
+            shape_id = trips["shape_id"].iat[rows.start]
+            if shape_id and {"shape_id", "shape_pt_lat", "shape_pt_lon"} <= set(shapes.columns):
+                # shapes.txt est déjà trié par (shape_id, shape_pt_sequence) au chargement
+                rows = sorted_rows(shapes, "shape_id", shape_id)
+                if rows.stop > rows.start:
+                    pts = latlon_points(shapes["shape_pt_lat"].iloc[rows], shapes["shape_pt_lon"].iloc[rows])
+                    if len(pts):
+                        return pts
+
+    if stimes is not None and stops is not None:
+        # stop_times.txt est déjà trié par (trip_id, stop_sequence) au chargement ;
+        # seule la colonne stop_id de la tranche est lue (ni copie, ni autres colonnes)
+        rows = sorted_rows(stimes, "trip_id", trip_id)
+        if rows.stop <= rows.start:
+            return pts
+        if stop_lookup is None:
+            stop_lookup = build_stop_lookup(stops)
+        found = lookup_stops(stop_lookup, stimes["stop_id"].iloc[rows].tolist())
+        if found:
+            pts = np.array([(lat, lon) for _, lat, lon in found])
+    return pts
+
+class StopLookup(NamedTuple):
+    """Arrêts indexés : stop_id → position, lat/lon en float64 (NaN si invalide), barycentre (ou None)."""
+    idx: pd.Index
+    lat: np.ndarray
+    lon: np.ndarray
+    center: tuple[float, float] | None
+    non_routable: frozenset[str]  # stop_id dont location_type != 0 (gares, entrées, nœuds…)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_stop_lookup(stops_df: pd.DataFrame) -> StopLookup:
+    """
+    Construit une seule fois (par GTFS) l'index des arrêts, leur barycentre et
+    l'ensemble des arrêts non routables.
+    L'index est un pd.Index unique (table de hachage C, 1re occurrence de chaque stop_id)
+    aligné sur les tableaux lat/lon : pas de dict Python d'un objet par arrêt.
+    """
+    # Déjà float64 si stops_df vient de load_gtfs_zip : to_float est alors un simple passage
+    lat = to_float(stops_df["stop_lat"])
+    lon = to_float(stops_df["stop_lon"])
+    center = None
+    if np.isfinite(lat).any() and np.isfinite(lon).any():
+        center = (float(np.nanmean(lat)), float(np.nanmean(lon)))
+    first = ~stops_df["stop_id"].duplicated(keep="first").to_numpy()
+    idx = pd.Index(stops_df["stop_id"].to_numpy(dtype=object)[first])
+    non_routable = frozenset()
+    if "location_type" in stops_df.columns:
+        # Vide ou invalide = 0 (arrêt) comme le prévoit GTFS ; comparaison numérique ("00" == 0)
+        lt = np.nan_to_num(to_float(stops_df["location_type"]), nan=0.0)
+        non_routable = frozenset(stops_df["stop_id"].to_numpy(dtype=object)[lt != 0].tolist())
+    return StopLookup(idx, lat[first], lon[first], center, non_routable)
+
+def lookup_stops(stop_lookup: StopLookup, stop_ids: list[str]) -> list[tuple[str, float, float]]:
+    """Renvoie (stop_id, lat, lon) pour les arrêts connus et géolocalisés, dans l'ordre demandé."""
+    idx, lat, lon = stop_lookup.idx, stop_lookup.lat, stop_lookup.lon
+    if not stop_ids or lat.size == 0:
+        return []
+    rows = idx.get_indexer(stop_ids)  # -1 si inconnu
+    sel_lat, sel_lon = lat[rows], lon[rows]
+    ok = (rows >= 0) & ~(np.isnan(sel_lat) | np.isnan(sel_lon))
+    ids = [sid for sid, keep in zip(stop_ids, ok.tolist()) if keep]
+    return list(zip(ids, sel_lat[ok].tolist(), sel_lon[ok].tolist()))
+
+# Décimales gardées dans les chemins envoyés au navigateur (1e-6° ≈ 0,1 m)
+PATH_DECIMALS = 6
+
+def lonlat_path(path: "Sequence[tuple[float, float]] | np.ndarray") -> list[list[float]]:
+    """
+    (lat, lon) → [[lon, lat], ...], le format de chemin natif de deck.gl (PathLayer).
+    Accepte une séquence de couples ou directement un tableau (N, 2).
+    Coordonnées arrondies : « -73.59998 » au lieu de « -73.59997999999999 » dans le JSON.
+    """
+    if len(path) == 0:
+        return []
+    return np.round(np.asarray(path, dtype=float)[:, ::-1], PATH_DECIMALS).tolist()
+
+# En dessous de cette longueur, la boucle Python reste plus rapide que le
+# surcoût d'allocation des tableaux NumPy.
+POLYLINE_NUMPY_MIN_LEN = 256
+
+def _decode_polyline_py(encoded: str) -> list[tuple[float, float]]:
+    """Boucle Python ; comme les chemins NumPy et Numba, s'arrête sur un varint final tronqué."""
+    coords = []; index = 0; lat = 0; lng = 0; n = len(encoded)
+    while index < n:
+        shift = result = 0
+        while True:
+            if index >= n: return coords
+            b = ord(encoded[index]) - 63; index += 1
+            result |= (b & 0x1f) << shift; shift += 5
+            if b < 0x20: break
+        lat += (result >> 1) ^ -(result & 1)  # zig-zag sans branche
+        shift = result = 0
+        while True:
+            if index >= n: return coords
+            b = ord(encoded[index]) - 63; index += 1
+            result |= (b & 0x1f) << shift; shift += 5
+            if b < 0x20: break
+        lng += (result >> 1) ^ -(result & 1)
+        coords.append((lat / 1e5, lng / 1e5))
+    return coords
+
+@functools.lru_cache(maxsize=256)
+def decode_polyline(encoded: str) -> np.ndarray:
+    """
+    Décode une polyline encodée (algorithme Google, précision 1e5) en tableau (N, 2)
+    de (lat, lon) float64. Résultat mémoïsé, donc rendu en lecture seule : une même
+    polyline n'est décodée qu'une fois et le tableau partagé ne peut pas être modifié.
+    Avec numba (optionnel), le noyau compilé de poly_numba est utilisé ; sinon
+    les chaînes longues sont décodées en une passe vectorisée NumPy :
+    chaque caractère est rattaché à son varint, les groupes de 5 bits sont
+    décalés puis sommés par varint, et les deltas zig-zag sont cumulés.
+    """
+    if decode_polyline_buf is not None:
+        out = decode_polyline_buf(np.frombuffer(encoded.encode("ascii"), dtype=np.uint8))
+    elif len(encoded) < POLYLINE_NUMPY_MIN_LEN:
+        out = np.array(_decode_polyline_py(encoded), dtype=np.float64).reshape(-1, 2)
+    else:
+        out = _decode_polyline_np(encoded)
+    out.flags.writeable = False
+    return out
+
+def _decode_polyline_np(encoded: str) -> np.ndarray:
+    """Décodage vectorisé NumPy (cf. decode_polyline) ; un varint final tronqué est ignoré."""
+
+    a = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    ends = a < 0x20                             # dernier caractère de chaque varint (b < 0x20)
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    group = np.concatenate(([0], np.cumsum(ends[:-1])))
+    shift = 5 * (np.arange(a.size) - starts[group])
+    vals = np.add.reduceat((a & 0x1f) << shift, starts)
+    if not ends[-1]:                            # varint final tronqué
+        vals = vals[:-1]
+    n = vals.size // 2
+    deltas = (vals >> 1) ^ -(vals & 1)          # zig-zag sans branche ni masque booléen
+    lat = np.cumsum(deltas[0:2 * n:2]) / 1e5
+    lng = np.cumsum(deltas[1:2 * n:2]) / 1e5
+    return np.column_stack((lat, lng))
+
+def select_detour_polylines(shapes_rt: Sequence[tuple[str, str]], wanted: Sequence[str]) -> list[str]:
+    """
+    Polylines RT à tracer pour une TripModifications, parmi les (shape_id, polyline) du flux :
+    celles dont le shape_id est désigné par ses SelectedTrips, ou toutes si elle n'en désigne
+    aucun. Désignées mais absentes du flux : liste vide (l'app relie alors les arrêts de
+    remplacement). shape_id est optionnel et peut se répéter : aucune entrée n'est fusionnée.
+    """
+    if not wanted:
+        return [enc for _, enc in shapes_rt]
+    wanted = set(wanted)
+    return [enc for sid, enc in shapes_rt if sid in wanted]
+
+def gunzip(raw: bytes) -> bytes:
+    """
+    Décompresse un flux gzip : inflate zlib direct ; gzip.decompress seulement si des
+    octets suivent le 1er membre (fichier multi-membres, bourrage).
+    Pas de libdeflate : sa taille de sortie vient du champ ISIZE du trailer, non vérifié,
+    qu'un fichier déposé peut fixer arbitrairement (sortie vide, allocation de plusieurs Go).
+    """
+    inflater = zlib.decompressobj(wbits=31)
+    try:
+        data = inflater.decompress(raw)
+        if not inflater.eof:  # flux tronqué : ne pas parser un flux partiel
+            raise DecodeError("Flux gzip tronqué (fin de membre absente).")
+        # Membre suivant tronqué → EOFError ; octets non gzip → BadGzipFile (OSError)
+        return gzip.decompress(raw) if inflater.unused_data else data
+    except (OSError, EOFError, zlib.error) as e:
+        raise DecodeError(f"Flux gzip illisible : {e}")
+
+def looks_like_textproto(raw: bytes, probe: int = 64) -> bool:
+    """
+    Heuristique : un textproto ne contient pas d'octets de contrôle (hors tab/CR/LF) ;
+    un binaire en contient dès les premiers octets (tags 0x08/0x0A/0x12, longueurs).
+    """
+    head = raw[:probe]
+    return bool(head) and all(b >= 32 and b != 127 or b in (9, 10, 13) for b in head)
+
+def _skip_field(buf: bytes, pos: int, wire_type: int) -> int:
+    """Position après la valeur d'un champ protobuf (hors groupes, absents de GTFS-rt)."""
+    if wire_type == 0:
+        return _DecodeVarint(buf, pos)[1]
+    if wire_type == 1:
+        return pos + 8
+    if wire_type == 2:
+        size, pos = _DecodeVarint(buf, pos)
+        return pos + size
+    if wire_type == 5:
+        return pos + 4
+    raise DecodeError(f"wire type {wire_type} non géré")
+
+def scan_entities(raw: bytes) -> bytes | None:
+    """
+    Pré-filtre un FeedMessage binaire sans le décoder : ne garde que le header et les
+    entités portant trip_modifications/shape (les VehiclePosition, Alert, TripUpdate… ne
+    sont jamais lus par l'app). Renvoie None si les octets ne se parcourent pas
+    proprement : l'appelant parse alors le flux complet.
+    Utile seulement avec le backend pur Python (~10× sur un flux mixte) : upb décode
+    le flux entier plus vite que ce balayage en Python.
+    """
+    out, start, pos, end = [], 0, 0, len(raw)
+    try:
+        while pos < end:
+            tag_start = pos
+            tag, pos = _DecodeVarint(raw, pos)
+            nxt = _skip_field(raw, pos, tag & 7)
+            if tag == 0x12:  # entity (champ 2, longueur-délimité)
+                size, sub = _DecodeVarint(raw, pos)
+                keep = False
+                while sub < nxt:
+                    sub_tag, sub = _DecodeVarint(raw, sub)
+                    if sub_tag >> 3 in ENTITY_WANTED_FIELDS:
+                        keep = True
+                        break
+                    sub = _skip_field(raw, sub, sub_tag & 7)
+                if not keep:
+                    out.append(raw[start:tag_start])
+                    start = nxt
+            pos = nxt
+    except (IndexError, DecodeError):
+        return None
+    if pos != end:
+        return None
+    if start == 0:
+        return raw  # rien à écarter : pas de copie
+    out.append(raw[start:])
+    return b"".join(out)
+
+def _parse_as(raw: bytes, kind: str) -> tuple[pb.FeedMessage, str]:
+    """
+    Parse `raw` au format `kind` ("textproto" ou "binary"), en essayant :
+      1) FeedMessage
+      2) TripModifications seul (wrappé en FeedMessage)
+    Renvoie (FeedMessage, cible retenue) ; DecodeError si aucune cible ne convient.
+    """
+    if kind == "textproto":
+        try:
+            text = raw.decode("utf-8", errors="strict")
+        except UnicodeDecodeError as e:
+            raise DecodeError(str(e))
+
+        def parse_into(msg):
+            text_format.Parse(text, msg, allow_unknown_extension=True)
+    else:
+        def parse_into(msg):
+            msg.ParseFromString(raw)
+
+    targets = ["FeedMessage", "TripModifications_wrapped"]
+    # Binaire : un FeedMessage commence par le tag de header (1) ou entity (2)
+    if kind == "binary" and raw and raw[0] >> 3 not in (1, 2):
+        targets.remove("FeedMessage")
+
+    err: Exception | None = None
+    feed_without_entity = None
+    for target in targets:
+        fm = pb.FeedMessage()
+        try:
+            if target == "FeedMessage" and kind == "binary" and PROTOBUF_BACKEND == "python":
+                fm.ParseFromString(scan_entities(raw) or raw)
+            elif target == "FeedMessage":
+                parse_into(fm)
+            else:  # TripModifications seul : parsé directement dans l'entité (pas de CopyFrom)
+                ent = fm.entity.add(); ent.id = "tm-1"
+                parse_into(ent.trip_modifications)
+        except Exception as e:
+            err = e
+            continue
+        # Un TripModifications binaire se parse aussi comme FeedMessage (champs 1-2 en
+        # longueur-délimitée) : sans entité, on tente d'abord le wrapper.
+        if kind == "binary" and target == "FeedMessage" and not fm.entity:
+            feed_without_entity = fm
+            continue
+        if target != "FeedMessage" and feed_without_entity is not None \
+                and not fm.entity[0].trip_modifications.modifications:
+            break  # wrapper sans modification : c'était bien un FeedMessage vide
+        return fm, target
+    if feed_without_entity is not None:
+        return feed_without_entity, "FeedMessage"
+    raise DecodeError(str(err))
+
+def parse_tripmod_feed(raw: bytes) -> tuple[pb.FeedMessage, dict]:
+    """
+    Après détection GZIP, choisit binaire ou textproto d'après le début du fichier
+    (cf. _parse_as pour les cibles essayées).
+    L'heuristique textproto peut se tromper sur un binaire dont les premiers octets sont
+    imprimables (tag 0x0A suivi d'identifiants texte) : si le parse texte échoue, le
+    binaire est tenté ensuite. Un fichier détecté binaire n'est jamais reparsé en texte.
+    En binaire, le premier tag écarte d'emblée FeedMessage s'il n'est ni header ni entity,
+    et, avec le backend pur Python, les entités sans intérêt pour l'app sont écartées
+    avant décodage (scan_entities).
+    """
+    meta = {"gzip": False, "mode": None}
+
+    # GZIP ?
+    if len(raw) >= 2 and raw[0] == 0x1F and raw[1] == 0x8B:
+        raw = gunzip(raw)
+        meta["gzip"] = True
+
+    kinds = ("textproto", "binary") if looks_like_textproto(raw) else ("binary",)
+    err: Exception | None = None
+    for kind in kinds:
+        try:
+            fm, target = _parse_as(raw, kind)
+        except DecodeError as e:
+            err = err or e  # message du format détecté, le plus parlant
+            continue
+        meta["mode"] = f"{kind}:{target}"
+        return fm, meta
+    raise DecodeError(f"Impossible de parser ce fichier comme GTFS‑rt : {err}")
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def parse_tripmod_cached(raw: bytes) -> tuple[bytes, dict]:
+    """
+    Version mise en cache de parse_tripmod_feed (clé = octets bruts).
+    Renvoie le FeedMessage re-sérialisé en binaire : le reparser à chaque rerun
+    est bien moins coûteux que la détection gzip/textproto.
+    """
+    fm, meta = parse_tripmod_feed(raw)
+    return fm.SerializePartialToString(), meta
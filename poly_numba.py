@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Décodage de polyline compilé avec Numba (dépendance optionnelle).
+Importé par gtfsrt_utils seulement si numba est installé ; sinon le décodage NumPy est utilisé.
+"""
+import numpy as np
+from numba import njit, types
+
+# Signature explicite : compilation (ou chargement du cache disque) dès l'import du module,
+# pas au premier tracé de détour. Entrée en lecture seule : np.frombuffer sur des bytes.
+_ASCII_BUF = types.Array(types.uint8, 1, "C", readonly=True)
+
+@njit(types.float64[:, :](_ASCII_BUF), cache=True, boundscheck=False, error_model="numpy")
+def decode_polyline_buf(buf: np.ndarray) -> np.ndarray:
+    """
+    Décode une polyline (octets ASCII en uint8) en tableau (k, 2) de (lat, lon).
+    Un seul passage sur le buffer, sortie préallouée ; un varint final tronqué est ignoré.
+    Signe zig-zag sans branche : (r >> 1) ^ -(r & 1).
+    """
+    n = buf.shape[0]
+    out = np.empty((n // 2 + 1, 2), np.float64)  # chaque point occupe au moins 2 octets
+    lat = 0
+    lng = 0
+    i = 0
+    k = 0
+    while i < n:
+        result = 0
+        shift = 0
+        while True:
+            if i >= n:
+                return out[:k]
+            b = np.int64(buf[i]) - 63
+            i += 1
+            result |= (b & 0x1F) << shift
+            shift += 5
+            if b < 0x20:
+                break
+        lat += (result >> 1) ^ -(result & 1)
+
+        result = 0
+        shift = 0
+        while True:
+            if i >= n:
+                return out[:k]
+            b = np.int64(buf[i]) - 63
+            i += 1
+            result |= (b & 0x1F) << shift
+            shift += 5
+            if b < 0x20:
+                break
+        lng += (result >> 1) ^ -(result & 1)
+
+        out[k, 0] = lat / 1e5
+        out[k, 1] = lng / 1e5
+        k += 1
+    return out[:k]
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""Les modules de l'app sont à la racine du dépôt (pas de paquet) : on l'ajoute au sys.path."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import gzip
+import uuid
+
+import pytest
+from google.protobuf.message import DecodeError
+
+import gtfsrt_utils as g
+
+
+def make_tripmods(n_trips: int = 3) -> "g.pb.TripModifications":
+    tm = g.pb.TripModifications()
+    sel = tm.selected_trips.add()
+    sel.trip_ids.extend(str(uuid.UUID(int=i)) for i in range(n_trips))  # 1er octet imprimable
+    sel.shape_id = "DET"
+    tm.service_dates.append("20240101")
+    mod = tm.modifications.add()
+    mod.start_stop_selector.stop_id = "S1"
+    mod.end_stop_selector.stop_id = "S3"
+    for i, sid in enumerate(["R1", "R2"]):
+        rs = mod.replacement_stops.add(); rs.stop_id = sid; rs.travel_time_to_stop = 60 * i
+    return tm
+
+
+def make_feed(n_shapes: int = 1) -> "g.pb.FeedMessage":
+    fm = g.pb.FeedMessage()
+    fm.header.gtfs_realtime_version = "2.0"
+    ent = fm.entity.add(); ent.id = "tm"
+    ent.trip_modifications.CopyFrom(make_tripmods())
+    for i in range(n_shapes):
+        ent = fm.entity.add(); ent.id = f"shape-{i}"
+        ent.shape.shape_id = f"SH{i}"; ent.shape.encoded_polyline = "_p~iF~ps|U"
+    return fm
+
+
+# --- gunzip -------------------------------------------------------------------
+
+PAYLOAD = make_feed(200).SerializeToString()
+GZ = gzip.compress(PAYLOAD)
+
+
+def test_gunzip_roundtrip():
+    assert g.gunzip(GZ) == PAYLOAD
+
+
+def test_gunzip_zero_padding():
+    assert g.gunzip(GZ + b"\0" * 4) == PAYLOAD
+
+
+def test_gunzip_multi_member():
+    assert g.gunzip(GZ + gzip.compress(b"tail")) == PAYLOAD + b"tail"
+
+
+@pytest.mark.parametrize("cut", [11, len(GZ) // 2, len(GZ) - 9, len(GZ) - 1])
+def test_gunzip_truncated(cut):
+    with pytest.raises(DecodeError):
+        g.gunzip(GZ[:cut])
+
+
+@pytest.mark.parametrize("tail", [b"junk", GZ[:len(GZ) // 2], b"\x1f\x8b\x08junk"])
+def test_gunzip_bad_trailing_member(tail):
+    with pytest.raises(DecodeError):
+        g.gunzip(GZ + tail)
+
+
+def test_gunzip_corrupt():
+    bad = bytearray(GZ); bad[len(bad) // 2] ^= 0xFF
+    with pytest.raises(DecodeError):
+        g.gunzip(bytes(bad))
+
+
+def test_parse_truncated_gzip_never_returns_partial_feed():
+    for cut in range(10, len(GZ), 37):
+        with pytest.raises(DecodeError):
+            g.parse_tripmod_feed(GZ[:cut])
+
+
+# --- parse_tripmod_feed -------------------------------------------------------
+
+FEED = make_feed()
+TRIPMODS = make_tripmods()
+
+
+@pytest.mark.parametrize("raw, mode, gz", [
+    (FEED.SerializeToString(), "binary:FeedMessage", False),
+    (str(FEED).encode(), "textproto:FeedMessage", False),
+    (gzip.compress(FEED.SerializeToString()), "binary:FeedMessage", True),
+    (TRIPMODS.SerializeToString(), "binary:TripModifications_wrapped", False),
+    (str(TRIPMODS).encode(), "textproto:TripModifications_wrapped", False),
+])
+def test_parse_formats(raw, mode, gz):
+    fm, meta = g.parse_tripmod_feed(raw)
+    assert meta == {"gzip": gz, "mode": mode}
+    tm = next(e.trip_modifications for e in fm.entity if e.HasField("trip_modifications"))
+    assert tm == TRIPMODS
+
+
+def test_binary_tripmods_sniffed_as_text_falls_back_to_binary():
+    raw = TRIPMODS.SerializeToString()
+    assert g.looks_like_textproto(raw)  # b"\n...\n$00000000-..." : faux positif de l'heuristique
+    fm, meta = g.parse_tripmod_feed(raw)
+    assert meta["mode"] == "binary:TripModifications_wrapped"
+    assert fm.entity[0].trip_modifications == TRIPMODS
+
+
+def test_parse_garbage_raises_decode_error():
+    with pytest.raises(DecodeError):
+        g.parse_tripmod_feed(b"hello world, not a feed")
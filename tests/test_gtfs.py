@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gtfsrt_utils as g
+
+STOPS_COLS = g.GTFS_USECOLS["stops.txt"]
+
+
+def zip_bytes(files: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, text in files.items():
+            zf.writestr(name, text)
+    return buf.getvalue()
+
+
+def read(text: str, usecols=STOPS_COLS) -> pd.DataFrame:
+    with zipfile.ZipFile(io.BytesIO(zip_bytes({"stops.txt": text}))) as zf:
+        return g.read_gtfs_csv(zf, "stops.txt", usecols)
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def reader(request, monkeypatch):
+    if request.param == "pandas":
+        monkeypatch.setattr(g, "pacsv", None)
+    elif g.pacsv is None:
+        pytest.skip("pyarrow absent")
+    g.load_gtfs_zip.clear()  # st.cache_data : pas de résultat d'un autre lecteur
+    yield request.param
+    g.load_gtfs_zip.clear()
+
+
+def as_lists(df: pd.DataFrame) -> dict[str, list[str]]:
+    return {c: [str(v) for v in df[c]] for c in df.columns}
+
+
+def test_read_basic(reader):
+    df = read("﻿stop_id,stop_name,stop_lat,stop_lon\n\"S,1\",A,45.5,-73.6\nS2,B,,\n")
+    assert as_lists(df) == {
+        "stop_id": ["S,1", "S2"], "stop_name": ["A", "B"], "stop_lat": ["45.5", ""], "stop_lon": ["-73.6", ""],
+    }
+
+
+def test_read_ragged_short_row(reader):
+    df = read("stop_id,stop_name,stop_lat,stop_lon,location_type\nS1,A,45.5,-73.6,0\nS99,Short\n")
+    assert as_lists(df) == {
+        "stop_id": ["S1", "S99"], "stop_name": ["A", "Short"], "stop_lat": ["45.5", ""],
+        "stop_lon": ["-73.6", ""], "location_type": ["0", ""],
+    }
+
+
+def test_read_duplicate_header_keeps_first(reader):
+    df = read("stop_id,stop_lat,stop_lat,stop_lon\nS1,45.5,45.6,-73.6\n")
+    assert list(df.columns) == ["stop_id", "stop_lat", "stop_lon"]
+    assert as_lists(df)["stop_lat"] == ["45.5"]
+
+
+@pytest.mark.parametrize("dtype", ["object", "arrow"])
+def test_to_category_matches_pandas(dtype):
+    if dtype == "arrow" and g.pa is None:
+        pytest.skip("pyarrow absent")
+    vals = ["T10", "T2", "é1", "", "T1", "T2", "Z"] * 3
+    values = pd.Series(vals, dtype=pd.ArrowDtype(g.pa.string()) if dtype == "arrow" else object)
+    cat = g.to_category(values)
+    assert list(cat.categories) == list(pd.Categorical(vals).categories)  # triées
+    assert list(np.asarray(cat)) == vals
+
+
+GTFS = {
+    "stops.txt": "stop_id,stop_lat,stop_lon,location_type\n"
+                 + "".join(f"S{i},{45.5 + i / 1000},{-73.6 + i / 1000},0\n" for i in range(1, 6))
+                 + "S99,Short\n",
+    "trips.txt": "route_id,service_id,trip_id,shape_id\nR,W,T2,SH2\nR,W,T1,SH1\nR,W,T3,\n",
+    "stop_times.txt": "trip_id,stop_id,stop_sequence\n"
+                      + "".join(f"T3,S{i},{10 - i}\n" for i in range(1, 6)),
+    "shapes.txt": "shape_id,shape_pt_lat,shape_pt_lon,shape_pt_sequence\n"
+                  "SH1,45.3,-73.3,3\nSH2,46,-74,1\nSH1,45.1,-73.1,1\nSH1,45.2,-73.2,2\n",
+}
+
+
+def test_load_gtfs_zip_sorted_and_sliced(reader):
+    dfs = g.load_gtfs_zip(zip_bytes(GTFS))
+    trips = dfs["trips.txt"]
+    assert isinstance(trips["trip_id"].dtype, pd.CategoricalDtype)
+    assert [str(t) for t in trips["trip_id"]] == ["T1", "T2", "T3"]
+    assert g.sorted_rows(trips, "trip_id", "T2") == slice(1, 2)
+    assert g.sorted_rows(trips, "trip_id", "NOPE") == slice(0, 0)
+    # shapes.txt triée par séquence
+    np.testing.assert_allclose(g.build_trip_shape(dfs, "T1"), [[45.1, -73.1], [45.2, -73.2], [45.3, -73.3]])
+    # Sans shape : chaîne des arrêts dans l'ordre de stop_sequence ; S99 sans coordonnées écarté
+    path = g.build_trip_shape(dfs, "T3")
+    np.testing.assert_allclose(path[:, 0], [45.505, 45.504, 45.503, 45.502, 45.501])
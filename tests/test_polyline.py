@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+import gtfsrt_utils as g
+
+# Exemple de la documentation Google : (38.5, -120.2), (40.7, -120.95), (43.252, -126.453)
+SAMPLE = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+SAMPLE_PTS = [[38.5, -120.2], [40.7, -120.95], [43.252, -126.453]]
+
+BACKENDS = {
+    "python": lambda e: np.array(g._decode_polyline_py(e), dtype=np.float64).reshape(-1, 2),
+    "numpy": g._decode_polyline_np,
+}
+if g.decode_polyline_buf is not None:
+    BACKENDS["numba"] = lambda e: g.decode_polyline_buf(np.frombuffer(e.encode("ascii"), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_decode_sample(backend):
+    np.testing.assert_allclose(BACKENDS[backend](SAMPLE), SAMPLE_PTS)
+
+
+@pytest.mark.parametrize("cut", range(1, len(SAMPLE) * 3 + 1))
+def test_backends_agree_on_truncated_input(cut):
+    encoded = (SAMPLE * 3)[:cut]
+    results = [BACKENDS[name](encoded) for name in BACKENDS]
+    for other in results[1:]:
+        np.testing.assert_array_equal(results[0], other)
+
+
+def test_backends_agree_below_question_mark():
+    # Caractères < '?' : b = c - 63 négatif, doit terminer le varint sur tous les chemins
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        chars = []
+        while len(chars) < 300:
+            chars += [chr(c) for c in rng.integers(95, 127, rng.integers(0, 6))]
+            chars.append(chr(rng.integers(32, 95)))
+        encoded = "".join(chars)
+        results = [BACKENDS[name](encoded) for name in BACKENDS]
+        for other in results[1:]:
+            np.testing.assert_array_equal(results[0], other)
+
+
+@pytest.mark.parametrize("encoded", ["", SAMPLE, SAMPLE[:-1], SAMPLE * 20])
+def test_decode_polyline_returns_readonly_array(encoded):
+    out = g.decode_polyline(encoded)
+    assert isinstance(out, np.ndarray) and out.dtype == np.float64
+    assert out.ndim == 2 and out.shape[1] == 2
+    assert not out.flags.writeable
+    assert out is g.decode_polyline(encoded)  # mémoïsé
+
+
+def test_lonlat_path_swaps_and_rounds():
+    assert g.lonlat_path(g.decode_polyline(SAMPLE))[0] == [-120.2, 38.5]
+    assert g.lonlat_path(np.empty((0, 2))) == []
+
+
+SHAPES_RT = [("A", "a1"), ("", "u1"), ("", "u2"), ("B", "b1"), ("A", "a2")]
+
+
+@pytest.mark.parametrize("wanted, expected", [
+    ([], ["a1", "u1", "u2", "b1", "a2"]),   # rien de désigné : tout, y compris sans shape_id
+    (["A"], ["a1", "a2"]),                  # shape_id répété : les deux entrées
+    (["B", "A"], ["a1", "b1", "a2"]),       # ordre du flux
+    (["MISSING"], []),                      # désignée mais absente : repli sur les arrêts
+])
+def test_select_detour_polylines(wanted, expected):
+    assert g.select_detour_polylines(SHAPES_RT, wanted) == expected